@@ -22,8 +22,9 @@ def _make_parser():
         "or '9.13'. Default is 'all' if '--uninstall' else 'latest'."
     )
     p.add_argument("-v", "--version", nargs="+", help=_)
-    _ = f"Installation prefix. Default: '{guess_prefix()}'."
-    p.add_argument("-p", "--prefix", help=_, default=guess_prefix())
+    default_prefix = guess_prefix()
+    _ = f"Installation prefix. Default: '{default_prefix}'."
+    p.add_argument("-p", "--prefix", help=_, default=default_prefix)
     _ = (
         "Uninstall this version of the runtime. "
         "Use '--version all' to uninstall all versions."
@@ -128,7 +129,7 @@ def mpython(args=None):
 
     arch = guess_arch()
 
-    if arch[:3] != "mac":
+    if not arch.is_mac:
         print("Execute mwpython only on Mac.")
         return 10
 
@@ -159,6 +160,10 @@ def mpython(args=None):
 
     supported_python_versions = SUPPORTED_PYTHON_VERSIONS[variant]
     if python_version not in supported_python_versions:
+        supported_python_versions = sorted(
+            supported_python_versions,
+            key=lambda x: tuple(map(int, x.split(".")))
+        )
         print(
             f"Python {python_version} is unsupported with MATLAB {variant}. "
             f"Supported versions are:", ", ".join(supported_python_versions)
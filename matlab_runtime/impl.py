@@ -12,12 +12,15 @@ import atexit
 import importlib
 import os
 import os.path as op
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import warnings
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 from .utils import (
     askuser,
@@ -31,7 +34,7 @@ from .utils import (
     matlab_release,
     matlab_version,
     guess_pymatlab_version,
-    url_download,
+    download_installer,
     ZipFileWithExecPerm,
 )
 
@@ -66,9 +69,19 @@ def install(version=None, prefix=None, auto_answer=False, patch=None):
     ------
     UserInterruptionError
         If the user answers no to a question.
+
+    Notes
+    -----
+    Downloaded installers are cached in
+    `$XDG_CACHE_HOME/matlab_runtime_installer/downloads` (by default,
+    `~/.cache/matlab_runtime_installer/downloads`), so that reinstalling
+    a version does not download it again. Set the environment variable
+    `"MATLAB_RUNTIME_NO_CACHE"` to disable this cache.
     """
     # --- iterate if multiple versions  --------------------------------
     if isinstance(version, (list, tuple, set)):
+        # Installs are kept sequential: installers write into the same
+        # prefix, and may ask for sudo (MacOS).
         list(map(lambda x: install(x, prefix, auto_answer, patch), version))
         return
 
@@ -81,72 +94,94 @@ def install(version=None, prefix=None, auto_answer=False, patch=None):
 
     if prefix is None:
         prefix = guess_prefix()
-    prefix = op.realpath(op.abspath(prefix))
+    prefix = op.realpath(prefix)
+    path = op.join(prefix, version)
 
     # --- check already exists -----------------------------------------
 
-    if op.exists(op.join(prefix, version, "VersionInfo.xml")):
+    if op.exists(op.join(path, "VersionInfo.xml")):
         # Do not raise_if_no so that we can exit peacefully
         ok = askuser("Runtime already exists. Reinstall?", "no", auto_answer)
         if not ok:
-            print("Do not reinstall:", op.join(prefix, version))
+            print("Do not reinstall:", path)
             return
         print("Runtime already exists. Reinstalling...")
 
-    elif find_runtime(version):
-        path = find_runtime(version)
-        msg = (
-            f"Runtime already exists in a different location ({path}). "
-            "Install anyway?"
-        )
-        ok = askuser(msg, "no", auto_answer)
-        if not ok:
-            print("Do not install:", op.join(prefix, version))
-            return
+    else:
+        other_path = find_runtime(version)
+        if other_path:
+            msg = (
+                "Runtime already exists in a different location "
+                f"({other_path}). Install anyway?"
+            )
+            ok = askuser(msg, "no", auto_answer)
+            if not ok:
+                print("Do not install:", path)
+                return
 
     askuser(f"Download installer from {url}?", "yes", auto_answer, raise_if_no)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = op.realpath(op.abspath(tmpdir))
+    # The pool is shut down (i.e., waits for the archive to be unzipped)
+    # before the temporary directory is deleted.
+    with tempfile.TemporaryDirectory() as tmpdir, \
+         ThreadPoolExecutor(1) as pool:
+        tmpdir = op.realpath(tmpdir)
 
         # --- download -------------------------------------------------
         print(f"Downloading from {url} ...")
-        installer = url_download(url, tmpdir)
+        installer = download_installer(url, tmpdir)
         print("done ->", installer)
 
         # --- unzip ----------------------------------------------------
+        unzipped = None
+        stop_unzip = threading.Event()
         if installer.endswith(".zip"):
 
             askuser(f"Unzip {installer}?", "yes", auto_answer, raise_if_no)
             print(f"Unzipping {installer} ...")
 
+            # Extract the license first, so that the user can read it
+            # while the rest of the archive is unzipped in the background
             with ZipFileWithExecPerm(installer) as zip:
-                zip.extractall(tmpdir)
+                if license in zip.namelist():
+                    zip.extract(license, tmpdir)
+            unzipped = pool.submit(
+                _unzip, installer, tmpdir, stop_unzip, exclude=[license]
+            )
 
-            if arch[:3] == "win":
+            if arch.is_win:
                 installer = op.join(tmpdir, "setup.exe")
             else:
                 installer = op.join(tmpdir, "install")
-            print("done ->", installer)
-
-        if not op.exists(installer):
-            print("No installer found in archive:", os.listdir(tmpdir))
-            raise FileNotFoundError("No installer found in archive")
 
         # --- install --------------------------------------------------
 
+        license_path = op.join(tmpdir, license)
         question = (
             "BY ENTERING 'YES', YOU ACCEPT THE TERMS OF THE MATLAB RUNTIME "
             "LICENSE, LINKED BELOW. THE MATLAB RUNTIME INSTALLER WILL BE "
             "RUN WITH THE ARGUMENT `-agreeToLicense yes`. "
             "IF YOU ARE NOT WILLING TO DO SO, ENTER 'NO' AND THE "
             "INSTALLATION WILL BE ABORTED."
-            f"\t{op.join(tmpdir, 'matlabruntime_license_agreement.pdf')}\n"
+            f"\t{license_path}\n"
         )
-        askuser(question, "yes", auto_answer, raise_if_no)
+        try:
+            askuser(question, "yes", auto_answer, raise_if_no)
+        except BaseException:
+            # Do not wait for the whole archive to be unzipped
+            stop_unzip.set()
+            raise
         print("License agreed.")
 
-        if arch[:3] == "mac" and macos_version() > (10, 14):
+        if unzipped:
+            unzipped.result()
+            print("done ->", installer)
+
+        if not op.exists(installer):
+            print("No installer found in archive:", os.listdir(tmpdir))
+            raise FileNotFoundError("No installer found in archive")
+
+        if arch.is_mac and macos_version() > (10, 14):
             print(
                 "Running the MATLAB installer requires signing off its "
                 "binaries, which requires sudo:"
@@ -168,10 +203,9 @@ def install(version=None, prefix=None, auto_answer=False, patch=None):
         if ret:
             print("Installation failed?")
         else:
-            print("done ->", op.join(prefix, version))
+            print("done ->", path)
 
     # --- check --------------------------------------------------------
-    path = op.join(prefix, version)
     if not op.exists(op.join(path, "VersionInfo.xml")):
         if op.exists(path):
             print(
@@ -186,24 +220,40 @@ def install(version=None, prefix=None, auto_answer=False, patch=None):
         raise FileNotFoundError("Runtime not found where it is expected.")
 
     # --- patch --------------------------------------------------------
-    if arch[:3] == "mac" and patch is not False:
+    if arch.is_mac and patch is not False:
         if patch is None:
             yesno = askuser(f"Patch runtime {path}?", "no", auto_answer)
         else:
             print(f"Patch runtime {path}")
             yesno = True
         if yesno:
-            patch_runtime(op.join(prefix, version))
+            patch_runtime(path)
 
     # --- goodbye ------------------------------------------------------
-    license = op.join(prefix, version, license)
-    print("Runtime succesfully installed at:", op.join(prefix, version))
-    print("License agreement available at:", license)
+    print("Runtime succesfully installed at:", path)
+    print("License agreement available at:", op.join(path, license))
 
     # --- all done! ----------------------------------------------------
     return
 
 
+def _unzip(path, dest, stop=None, exclude=()):
+    with ZipFileWithExecPerm(path) as zip:
+        members = [x for x in zip.infolist() if x.filename not in exclude]
+        zip.extractall(dest, members, stop=stop)
+
+
+def _map_versions(func, versions, auto_answer):
+    # Uninstalling versions is independent, so they are run
+    # concurrently -- unless the user must answer questions, in which
+    # case prompts would compete for stdin.
+    versions = list(versions)
+    if not auto_answer or len(versions) < 2:
+        return list(map(func, versions))
+    with ThreadPoolExecutor(len(versions)) as pool:
+        return list(pool.map(func, versions))
+
+
 def uninstall(version=None, prefix=None, auto_answer=False):
     """
     Uninstall the matlab runtime.
@@ -223,11 +273,14 @@ def uninstall(version=None, prefix=None, auto_answer=False):
     """
     # --- iterate if multiple versions  --------------------------------
     if isinstance(version, (list, tuple, set)):
-        for a_version in version:
+        def uninstall_one(a_version):
             try:
                 uninstall(a_version, prefix, auto_answer)
             except Exception as e:
-                print(f"[{type(e)}] Failed to uninstall runtime:", version, e)
+                print(
+                    f"[{type(e)}] Failed to uninstall runtime:", a_version, e
+                )
+        _map_versions(uninstall_one, version, auto_answer)
         return
 
     # --- prepare  -----------------------------------------------------
@@ -243,34 +296,72 @@ def uninstall(version=None, prefix=None, auto_answer=False):
     if version.lower() == "all":
         rmdir = prefix
     else:
-        rmdir = op.join(rmdir, version)
+        rmdir = op.join(prefix, version)
 
     # --- uninstall  ---------------------------------------------------
     question = f"Remove directory {rmdir} and its content?"
     askuser(question, "yes", auto_answer, raise_if_no)
 
-    if arch[:3] == "win":
+    if arch.is_win:
         # --- Windows: call uninstaller ---
         if version == "all":
-            versions = [op.join(prefix, ver) for ver in os.listdir(prefix)]
+            with os.scandir(prefix) as entries:
+                versions = [entry.path for entry in entries if entry.is_dir()]
         else:
             versions = [version]
-        for ver in versions:
-            subprocess.run([op.join(
+        # Uninstallers are independent: run them concurrently
+        procs = [
+            subprocess.Popen([op.join(
                 prefix, ver, "bin", arch, "Uninstall_MATLAB_Runtime.exe"
             )])
+            for ver in versions
+        ]
+        for proc in procs:
+            proc.wait()
     else:
         # --- Unix: remove folder ---
-        shutil.rmtree(rmdir)
+        if version == "all":
+            # Remove each version's tree concurrently, then the rest
+            with os.scandir(prefix) as entries:
+                paths = [
+                    entry.path for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+            if paths:
+                with ThreadPoolExecutor(len(paths)) as pool:
+                    list(pool.map(_rmtree, paths))
+        _rmtree(rmdir)
 
     print("Runtime(s) succesfully uninstalled from:", rmdir)
 
 
-_DEPLOYED_MODULES = {}
+def _rmtree(path):
+    # `rm -rf` removes large trees much faster than `shutil.rmtree`
+    rm = shutil.which("rm")
+    if rm:
+        # Unlike `shutil.rmtree`, `rm -f` silently ignores missing paths
+        if not op.exists(path):
+            raise FileNotFoundError(f"No such file or directory: '{path}'")
+        subprocess.run([rm, "-rf", "--", path], check=True)
+    else:
+        shutil.rmtree(path)
+
+
+_DEPLOYED_MODULES = weakref.WeakValueDictionary()
 _INITIALIZED = {"SDK": False, "RUNTIME": False}
 _CPP = "matlabruntimeforpython_abi3"
 _SDK = "matlab_pysdk.runtime"
 _MLB = "matlab"
+_MODULES = {}
+
+
+def _import(name):
+    # `importlib.import_module` takes the import lock on every call,
+    # so keep the handles to the SDK modules once they are imported.
+    module = _MODULES.get(name)
+    if module is None:
+        module = _MODULES[name] = importlib.import_module(name)
+    return module
 
 
 def init(
@@ -328,13 +419,12 @@ def init(
 
     # --- install version  ---------------------------------------------
     if not path:
+        path = op.join(prefix, version)
         if install_if_missing:
             install(version, prefix, auto_answer)
-            path = op.join(prefix, version)
         else:
             raise FileNotFoundError(
-                "Version not found in installed runtimes:",
-                op.join(prefix, version)
+                "Version not found in installed runtimes:", path
             )
 
     # --- prepare paths  -----------------------------------------------
@@ -344,29 +434,31 @@ def init(
     bin = op.join(path, 'bin', arch)
 
     # --- set paths  ---------------------------------------------------
-    if arch[:3] == "win":
+    if arch.is_win:
+        # Python >= 3.8 no longer searches PATH when resolving the
+        # dependencies of extension modules.
+        if hasattr(os, "add_dll_directory"):
+            os.add_dll_directory(ext)
+            os.add_dll_directory(bin)
+        # The runtime itself still loads its own libraries through PATH.
         PATH = os.environ['PATH'].split(os.pathsep)
-        os.environ['PATH'] = os.pathsep.join([ext, bin] + PATH)
+        if ext not in PATH or bin not in PATH:
+            os.environ['PATH'] = os.pathsep.join([ext, bin] + PATH)
 
-    sys.path.insert(0, bin)
-    sys.path.insert(0, mod)
-    sys.path.insert(0, sdk)
-    sys.path.insert(0, ext)
+    sys.path[:0] = [ext, sdk, mod, bin]
 
     # --- imports  -----------------------------------------------------
-    importlib.import_module(_CPP)
-    importlib.import_module(_SDK)
-    matlab = importlib.import_module(_MLB)
+    _import(_CPP)
+    _import(_SDK)
+    matlab = _import(_MLB)
 
     # --- check version  -----------------------------------------------
     try:
-        current_version = guess_pymatlab_version(matlab)
-        current_version = tuple(map(int, current_version.split(".")[:2]))
+        current_version = _parse_version(guess_pymatlab_version(matlab))
     except ValueError:
         current_version = None
 
-    target_version = matlab_version(version)
-    target_version = tuple(map(int, target_version.split(".")[:2]))
+    target_version = _parse_version(matlab_version(version))
 
     if current_version is None:
         warnings.warn("Could not determine version of matlab-python.")
@@ -379,11 +471,22 @@ def init(
     _INITIALIZED["SDK"] = version
 
 
+_VER_RE = re.compile(r"(\d+)\.(\d+)")
+
+
+def _parse_version(version):
+    # "major.minor[...]" -> (major, minor)
+    match = _VER_RE.match(version)
+    if not match:
+        raise ValueError(f"Not a version: {version}")
+    return int(match[1]), int(match[2])
+
+
 class _PathInitializer:
     def __init__(self):
         if not _INITIALIZED["SDK"]:
             init()
-        self.cppext_handle = importlib.import_module(_CPP)
+        self.cppext_handle = _import(_CPP)
 
 
 def import_deployed(*packages, option_list=tuple()):
@@ -403,19 +506,19 @@ def import_deployed(*packages, option_list=tuple()):
     if not _INITIALIZED["RUNTIME"]:
         init_runtime(option_list)
 
-    sdk = importlib.import_module(_SDK)
+    sdk = _import(_SDK)
 
     handles = []
     for package in packages:
         if isinstance(package, str):
             package = importlib.import_module(package)
-        handle = _DEPLOYED_MODULES.get(package, lambda: None)()
+        handle = _DEPLOYED_MODULES.get(package)
         if handle is None:
             handle = sdk.DeployablePackage(
                 _PathInitializer(), package.__name__, package.__file__
             )
             handle.initialize()
-            _DEPLOYED_MODULES[package] = weakref.ref(handle)
+            _DEPLOYED_MODULES[package] = handle
         handles.append(handle)
 
     return handles[0] if len(handles) == 1 else tuple(handles)
@@ -439,10 +542,10 @@ def init_runtime(option_list=tuple(), error_if_already_init=False):
     if not _INITIALIZED.get("SDK", False):
         init()
 
-    cppext = importlib.import_module(_CPP)
+    cppext = _import(_CPP)
 
     arch = guess_arch()
-    if arch[:3] == "mac":
+    if arch.is_mac:
         ignored_option_found = False
         for option in option_list:
             if option in ('-nodisplay', '-nojvm'):
@@ -453,7 +556,7 @@ def init_runtime(option_list=tuple(), error_if_already_init=False):
                 'Options "-nodisplay" and "-nojvm" are ignored on Mac.'
                 'They must be passed to mwpython in order to take effect.'
             )
-    elif arch[:3] == "gln":
+    elif arch.is_linux:
         if not os.environ.get("DISPLAY", ""):
             # Headless environment -> ensure -nodisplay is set
             if "-nodisplay" not in option_list:
@@ -467,15 +570,15 @@ def terminate_runtime():
     """
     Terminate runtime.
     """
-    if _INITIALIZED["RUNTIME"]:
-        cppext = importlib.import_module("matlabruntimeforpython_abi3")
-        cppext.terminateApplication()
-        _INITIALIZED["RUNTIME"] = False
+    if not _INITIALIZED["RUNTIME"]:
+        return
+    # Imported by `init_runtime`
+    _MODULES[_CPP].terminateApplication()
+    _INITIALIZED["RUNTIME"] = False
 
 
 @atexit.register
 def __atexit():
-    for package in _DEPLOYED_MODULES.values():
-        if package() is not None:
-            package().terminate()
+    for handle in list(_DEPLOYED_MODULES.values()):
+        handle.terminate()
     terminate_runtime()
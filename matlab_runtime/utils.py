@@ -1,17 +1,28 @@
+import base64
+import email.utils
+import functools
+import hashlib
+import http.client
 import json
 import math
 import os
 import os.path as op
 import platform
+import posixpath
+import re
 import shutil
+import socket
 import stat
 import sys
 import tempfile
+import threading
+import time
 import zipfile
 import tarfile
+from collections.abc import Mapping
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import datetime
 from urllib import error, parse, request
-from xml.etree import ElementTree
 
 
 try:
@@ -46,16 +57,23 @@ class UserInterruptionError(RuntimeError):
 # ----------------------------------------------------------------------
 
 
+_YES_OPTS = "([yes]/no)"
+_NO_OPTS = "(yes/[no])"
+
+
 def askuser(question, default="yes", auto_answer=False, raise_if_no=False):
-    options = "([yes]/no)" if default == "yes" else "(yes/[no])"
     if auto_answer:
-        yesno = True if default == "yes" else False
+        # Fast path: nothing to format or read
+        if default != "yes" and raise_if_no:
+            raise UserInterruptionError(question)
+        return default == "yes"
+
+    options = _YES_OPTS if default == "yes" else _NO_OPTS
+    answer = input(f"{question} {options} ").strip()[:1].lower()
+    if default == "yes":
+        yesno = answer in ("y", "")
     else:
-        yesno = input(f"{question} {options} ").strip()
-        if not yesno:
-            yesno = True if default == "yes" else False
-        else:
-            yesno = yesno[:1].lower() == "y"
+        yesno = answer == "y"
     if not yesno and raise_if_no:
         raise UserInterruptionError(question)
     return yesno
@@ -70,32 +88,128 @@ def askuser(question, default="yes", auto_answer=False, raise_if_no=False):
 # preserve executable permissions, and does not preserve symlinks.
 # This somehow breaks the linkking of the dylibs (on mac -- but probably
 # also on linux). This patched ZipFile fixes these two issues.
+#
+# The runtime installers are also large (hundreds of MB, thousands of
+# entries), so members are inflated concurrently (zlib releases the GIL)
+# and copied to disk with a large buffer.
+
+_COPY_BUFSIZE = 4 * 1024 * 1024
+_CAN_SYMLINK = sys.platform != "win32" and hasattr(os, "symlink")
 
 
 class ZipFileWithExecPerm(zipfile.ZipFile):
 
+    def extractall(self, path=None, members=None, pwd=None, max_workers=None,
+                   stop=None):
+        """
+        Extract all members, using a pool of threads.
+
+        Each thread reads from its own handle on the archive, so that
+        members can be decompressed and written concurrently.
+
+        If `stop` (a `threading.Event`) is set, members that are not
+        yet being extracted are skipped.
+        """
+        if members is None:
+            members = self.infolist()
+        members = [
+            member if isinstance(member, zipfile.ZipInfo)
+            else self.getinfo(member)
+            for member in members
+        ]
+
+        if path is None:
+            path = os.getcwd()
+        else:
+            path = os.fspath(path)
+
+        # Extraction mixes inflate (CPU) and writes (IO), so use more
+        # threads than cores, as ThreadPoolExecutor does by default.
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        if self.filename is None or max_workers == 1 or len(members) < 2:
+            for member in members:
+                if stop is not None and stop.is_set():
+                    return
+                self._extract_member(member, path, pwd)
+            return
+
+        # Largest members first, so that the pool does not end up
+        # waiting on a single large member started last.
+        members = sorted(members, key=lambda x: x.file_size, reverse=True)
+
+        pwd = pwd or self.pwd
+        local = threading.local()
+        handles = []
+        lock = threading.Lock()
+
+        def extract(member):
+            if stop is not None and stop.is_set():
+                return
+            handle = getattr(local, "handle", None)
+            if handle is None:
+                handle = local.handle = type(self)(self.filename)
+                with lock:
+                    handles.append(handle)
+            handle._extract_member(member, path, pwd)
+
+        try:
+            with ThreadPoolExecutor(max_workers) as pool:
+                list(pool.map(extract, members))
+        finally:
+            for handle in handles:
+                handle.close()
+
+    def _member_path(self, member, targetpath):
+        # Same sanitization as `ZipFile._extract_member`
+        arcname = member.filename.replace("/", op.sep)
+        if op.altsep:
+            arcname = arcname.replace(op.altsep, op.sep)
+        arcname = op.splitdrive(arcname)[1]
+        invalid_path_parts = ("", op.curdir, op.pardir)
+        arcname = op.sep.join(
+            x for x in arcname.split(op.sep) if x not in invalid_path_parts
+        )
+        if op.sep == "\\":
+            arcname = self._sanitize_windows_name(arcname, op.sep)
+        return op.normpath(op.join(targetpath, arcname))
+
     def _extract_member(self, member, targetpath, pwd):
         if not isinstance(member, zipfile.ZipInfo):
             member = self.getinfo(member)
 
-        targetpath = super()._extract_member(member, targetpath, pwd)
-
+        targetpath = self._member_path(member, targetpath)
         attr = member.external_attr >> 16
 
+        # `exist_ok` makes this safe when called from concurrent workers
+        if member.is_dir():
+            os.makedirs(targetpath, exist_ok=True)
+            if attr != 0:
+                os.chmod(targetpath, attr)
+            return targetpath
+
+        upperdirs = op.dirname(targetpath)
+        if upperdirs:
+            os.makedirs(upperdirs, exist_ok=True)
+
         # https://bugs.python.org/issue27318
-        if (
-            platform.system() != "Windows" and
-            stat.S_ISLNK(attr) and
-            hasattr(os, "symlink")
-        ):
-            link = self.open(member, pwd=pwd).read()
-            shutil.move(targetpath, targetpath + ".__backup__")
+        # Symlinks are created directly from the stored target, without
+        # first writing it out as a regular file.
+        if _CAN_SYMLINK and stat.S_ISLNK(attr):
+            link = os.fsdecode(self.read(member, pwd=pwd))
             try:
-                return os.symlink(link, targetpath)
+                try:
+                    os.symlink(link, targetpath)
+                except FileExistsError:
+                    os.remove(targetpath)
+                    os.symlink(link, targetpath)
+                return targetpath
             except OSError:     # No permission to create symlink
-                shutil.move(targetpath + ".__backup__", targetpath)
                 pass
 
+        with self.open(member, pwd=pwd) as src, \
+             open(targetpath, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
         # https://stackoverflow.com/questions/39296101
         if attr != 0:
             os.chmod(targetpath, attr)
@@ -108,23 +222,197 @@ class ZipFileWithExecPerm(zipfile.ZipFile):
 # ----------------------------------------------------------------------
 
 
-class NoRedirection(request.HTTPErrorProcessor):
-    # https://stackoverflow.com/questions/29327674
-    def http_response(self, request, response):
-        return response
-    https_response = http_response
+# Errors raised when reusing a connection that the server has closed.
+# Others (notably timeouts) are not retried on a new connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class HTTPConnectionPool:
+    # Keep-alive HTTP(S) connections, reused across requests to the same
+    # host, so that repeated requests (e.g., the HEAD probes sent to
+    # ssd.mathworks.com by `guess_installer`) only pay the TCP+TLS
+    # handshake once. Safe to share between threads.
+
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+    def __init__(self, maxsize=8, timeout=None, max_redirect=10):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.max_redirect = max_redirect
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _proxy(scheme, host):
+        # Honor *_proxy environment variables, like urllib does.
+        # Return the proxy's "host:port", and the headers that carry its
+        # credentials (if any), or None.
+        proxy = request.getproxies().get(scheme)
+        if not proxy or request.proxy_bypass(host):
+            return None
+        if "://" not in proxy:
+            proxy = "http://" + proxy
+        proxy = parse.urlsplit(proxy)
+        netloc = proxy.netloc.rpartition("@")[2]
+        headers = {}
+        if proxy.username is not None:
+            credentials = "%s:%s" % (
+                parse.unquote(proxy.username),
+                parse.unquote(proxy.password or ""),
+            )
+            credentials = base64.b64encode(credentials.encode()).decode()
+            headers["Proxy-Authorization"] = "Basic " + credentials
+        return netloc, headers
+
+    def _acquire(self, scheme, host):
+        with self._lock:
+            idle = self._idle.get((scheme, host))
+            if idle:
+                return idle.pop(), True
+        proxy = self._proxy(scheme, parse.urlsplit("//" + host).hostname)
+        proxy, proxy_headers = proxy or (None, None)
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                proxy or host, timeout=self.timeout
+            )
+            if proxy:
+                conn.set_tunnel(host, headers=proxy_headers)
+        elif scheme == "http":
+            conn = http.client.HTTPConnection(
+                proxy or host, timeout=self.timeout
+            )
+        else:
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+        return conn, False
+
+    def _release(self, scheme, host, conn):
+        with self._lock:
+            idle = self._idle.setdefault((scheme, host), [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    @staticmethod
+    def _settimeout(conn, timeout):
+        # Applies to new connections, and to idle ones being reused
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+    def _exchange(self, conn, method, path, headers, timeout):
+        self._settimeout(conn, timeout)
+        try:
+            conn.request(method, path, headers=headers)
+            return conn.getresponse()
+        except BaseException:
+            conn.close()
+            raise
+
+    def _send(self, method, url, headers, timeout):
+        path, url = url, parse.urlsplit(url)
+        proxy = url.scheme == "http" and self._proxy("http", url.hostname)
+        if proxy:
+            # Plain HTTP proxies expect the absolute URL, and their
+            # credentials with each request
+            headers = {**proxy[1], **(headers or {})}
+        else:
+            path = url.path or "/"
+            if url.query:
+                path += "?" + url.query
+        conn, reused = self._acquire(url.scheme, url.netloc)
+        try:
+            res = self._exchange(conn, method, path, headers, timeout)
+        except _STALE_CONNECTION_ERRORS:
+            if not reused:
+                raise
+            # The server closed our idle connection: use a fresh one
+            conn, _ = self._acquire(url.scheme, url.netloc)
+            res = self._exchange(conn, method, path, headers, timeout)
+        release = (lambda: self._release(url.scheme, url.netloc, conn))
+        return PooledResponse(res, conn, release, url.geturl())
+
+    def request(self, method, url, headers=None, redirect=True,
+                timeout=None):
+        """
+        Send a request and return the response, which must be closed
+        (or used as a context manager) to give the connection back.
+        `timeout` defaults to the pool's timeout.
+        """
+        headers = dict(headers or {})
+        if timeout is None:
+            timeout = self.timeout
+        for _ in range(self.max_redirect + 1):
+            res = self._send(method, url, headers, timeout)
+            location = res.getheader("Location")
+            redirected = res.status in self.REDIRECT_CODES and location
+            if not (redirect and redirected):
+                return res
+            res.close()
+            url = parse.urljoin(url, location)
+            if res.status == 303 and method != "HEAD":
+                method = "GET"
+        raise error.HTTPError(
+            url, res.status, "Too many redirections", res.headers, None
+        )
+
+
+class PooledResponse:
+    # Wraps a `http.client.HTTPResponse` and gives its connection back
+    # to the pool once the body has been consumed. `url` is the URL the
+    # response was obtained from (i.e., after redirections).
+
+    def __init__(self, response, connection, release, url):
+        self._response = response
+        self._connection = connection
+        self._release = release
+        self._closed = False
+        self.url = url
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, *args):
+        return self._response.read(*args)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        res = self._response
+        if not res.will_close and (res.isclosed() or res.length == 0):
+            res.read()
+            res.close()
+            self._release()
+        else:
+            res.close()
+            self._connection.close()
+
+
+# Enough idle connections per host to serve all concurrent update probes
+# (one per update number) on a second round of probing.
+_POOL = HTTPConnectionPool(maxsize=16)
 
 
 if tqdm:
     def _download_hook():
         data = {"bar": None, "nb_bytes": 0}
 
-        def callback(nb_blocks, block_size, file_size):
+        def callback(nb_bytes, file_size):
             if not data["bar"]:
                 if file_size < 0:
                     file_size = float('inf')
                 data["bar"] = tqdm.tqdm(total=file_size)
-            nb_bytes = nb_blocks * block_size
             data["bar"].update(nb_bytes - data["nb_bytes"])
             data["nb_bytes"] = nb_bytes
 
@@ -133,8 +421,7 @@ else:
     def _download_hook():
         data = {"started": False}
 
-        def callback(nb_blocks, block_size, file_size):
-            nb_bytes = nb_blocks * block_size
+        def callback(nb_bytes, file_size):
             if not data["started"]:
                 if file_size < 0:
                     print(f"{0:>3d} B ", end="")
@@ -156,42 +443,310 @@ else:
         return callback, data
 
 
-def url_exists(url):
-    opener = request.build_opener(NoRedirection)
-    req = request.Request(url, method="HEAD")
+# Seconds after which a HEAD probe is considered unanswered
+_URL_EXISTS_TIMEOUT = 3.0
+
+
+def url_exists(url, timeout=_URL_EXISTS_TIMEOUT):
+    # Return None if the server does not answer in time, so that a
+    # stalled probe cannot hang the install, but is not mistaken for a
+    # missing resource either.
     try:
-        with opener.open(req) as res:
-            status = res.status
-        return status < 400
-    except error.HTTPError:
-        return False
+        res = _POOL.request("HEAD", url, redirect=False, timeout=timeout)
+    except socket.timeout:
+        return None
+    with res:
+        return res.status < 400
+
+
+def url_open(url, headers=None):
+    res = _POOL.request("GET", url, headers)
+    if res.status >= 400:
+        res.close()
+        raise error.HTTPError(url, res.status, res.reason, res.headers, None)
+    return res
+
+
+def _get_umask():
+    # Linux exposes the umask without changing it, which is safer when
+    # other threads may be creating files.
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    # Elsewhere, the umask can only be read by setting it
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Installers larger than this are downloaded over several connections
+_PARALLEL_DOWNLOAD_THRESHOLD = 100 * 1024 * 1024
+
+
+class _RangesNotSupported(DownloadError):
+    ...
 
 
-def url_download(url, out, retry=5, verbose=True):
+def url_download(url, out, retry=5, verbose=True, headers=None, nb_chunks=8):
     if op.isdir(out):
         basename = op.basename(parse.urlparse(url).path)
         out = op.join(out, basename)
 
+    # Files are only moved to `out` once complete, so an existing file
+    # is a previous download, which is kept if the remote file has not
+    # been modified since.
+    if op.exists(out) and _url_not_modified(url, out, headers):
+        return out
+
     if verbose:
         hook, hookdata = _download_hook()
     else:
         hook, hookdata = None, {}
 
-    res = exc = None
-    for _ in range(retry):
+    fd, part = tempfile.mkstemp(
+        ".part", op.basename(out) + ".", op.dirname(op.abspath(out))
+    )
+    os.close(fd)
+    try:
+        downloaded = False
+        if nb_chunks > 1:
+            size, url_ = _url_range_info(url, headers)
+            if size >= _PARALLEL_DOWNLOAD_THRESHOLD:
+                try:
+                    _url_download_ranges(
+                        url_, part, size, nb_chunks, retry, headers, hook
+                    )
+                    downloaded = True
+                except _RangesNotSupported:
+                    pass
+        if not downloaded:
+            _url_download_stream(url, part, retry, headers, hook)
+        # `mkstemp` creates private files, whereas the download should
+        # get the same mode as any other new file.
+        os.chmod(part, 0o666 & ~_get_umask())
+        os.replace(part, out)
+
+    finally:
+        if "bar" in hookdata:
+            hookdata["bar"].close()
+        if op.exists(part):
+            os.remove(part)
+
+    return out
+
+
+def _url_not_modified(url, path, headers=None):
+    # Whether the remote file is not more recent than the local one.
+    # If the server cannot be reached, the local file is kept, so that
+    # a complete download can be reused offline.
+    mtime = op.getmtime(path)
+    headers = dict(headers or {})
+    headers["If-Modified-Since"] = email.utils.formatdate(mtime, usegmt=True)
+    try:
+        with _POOL.request("HEAD", url, headers) as res:
+            if res.status == 304:
+                return True
+            if res.status >= 400:
+                return False
+            # Some servers ignore If-Modified-Since: compare the date
+            # and size of the remote file with those of the local one.
+            modified = res.getheader("Last-Modified")
+            size = res.getheader("Content-Length")
+    except error.HTTPError:     # Too many redirections
+        return False
+    except (OSError, http.client.HTTPException):
+        return True
+    try:
+        modified = email.utils.parsedate_to_datetime(modified).timestamp()
+        size = int(size)
+    except (TypeError, ValueError):
+        return False
+    return modified <= mtime and size == op.getsize(path)
+
+
+def _url_size(url, headers=None):
+    # Size of the resource, or -1 if unknown
+    try:
+        with _POOL.request("HEAD", url, headers) as res:
+            if res.status >= 400:
+                return -1
+            return int(res.getheader("Content-Length", -1))
+    except Exception:
+        return -1
+
+
+def _url_range_info(url, headers=None):
+    # Size of the resource, or -1 if it cannot be downloaded in ranges,
+    # and its location after redirections.
+    try:
+        with _POOL.request("HEAD", url, headers) as res:
+            if res.status >= 400:
+                return -1, url
+            if res.getheader("Accept-Ranges", "").lower() != "bytes":
+                return -1, res.url
+            return int(res.getheader("Content-Length", -1)), res.url
+    except Exception:
+        return -1, url
+
+
+# Statuses worth retrying; anything else >= 400 fails immediately
+_RETRY_STATUS = (500, 502, 503, 504)
+# Seconds to wait before the n-th retry: backoff * 2 ** (n - 1)
+_RETRY_BACKOFF = 1.0
+
+
+def _retry_wait(attempt, exc):
+    # Raise if `exc` is not worth retrying, else wait before next attempt
+    if isinstance(exc, error.HTTPError) and exc.code not in _RETRY_STATUS:
+        raise DownloadError(str(exc))
+    time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+
+def _bufsize(size):
+    # Read buffer scaled on the download size: `HTTPResponse.read(n)`
+    # allocates `n` bytes, which is wasteful for small files, while
+    # small reads mean many more syscalls for large ones.
+    if size < 0:
+        return _COPY_BUFSIZE
+    return min(max(size // 1000, 8192), _COPY_BUFSIZE)
+
+
+def _preallocate(f, size):
+    # Reserve disk space upfront, which avoids fragmenting large files
+    if hasattr(os, "posix_fallocate"):
         try:
-            res = request.urlretrieve(url, out, hook)
-            break
-        except Exception as e:
-            exc = e
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:     # Not supported by the file system
+            pass
+    f.truncate(size)
+
+
+def _url_download_stream(url, out, retry, headers, hook):
+    # Download over a single connection. If the transfer is interrupted,
+    # resume from the last byte written rather than starting over.
+    nb_bytes, size, exc = 0, -1, None
+    with open(out, "wb") as f:
+        for attempt in range(retry):
+            if attempt:
+                _retry_wait(attempt - 1, exc)
+            request_headers = dict(headers or {})
+            if nb_bytes:
+                request_headers["Range"] = f"bytes={nb_bytes}-"
+            try:
+                with url_open(url, request_headers) as res:
+                    if nb_bytes and res.status != 206:
+                        # Range ignored by the server: start over
+                        nb_bytes = 0
+                        f.seek(0)
+                        f.truncate()
+                    if not nb_bytes:
+                        size = int(res.getheader("Content-Length", -1))
+                        if size > 0:
+                            _preallocate(f, size)
+                    bufsize = _bufsize(size)
+                    while True:
+                        block = res.read(bufsize)
+                        if not block:
+                            break
+                        f.write(block)
+                        nb_bytes += len(block)
+                        if hook:
+                            hook(nb_bytes, size)
+                if 0 <= size != nb_bytes:
+                    raise http.client.IncompleteRead(b"", size - nb_bytes)
+                return
+            except Exception as e:
+                exc = e
+
+    raise DownloadError(str(exc))
+
+
+def _url_download_ranges(url, out, size, nb_chunks, retry, headers, hook):
+    # Download `nb_chunks` byte ranges concurrently, over as many
+    # connections, and write each of them at its offset in `out`.
+    with open(out, "wb") as f:
+        _preallocate(f, size)
+        _url_fetch_ranges(url, f, size, nb_chunks, retry, headers, hook)
+
+
+def _pwrite(f, block, offset, lock):
+    # Write `block` at `offset` without moving the shared file position
+    # (or under a lock where positional writes are not available).
+    if hasattr(os, "pwrite"):
+        view = memoryview(block)
+        while view:
+            nb_written = os.pwrite(f.fileno(), view, offset)
+            view, offset = view[nb_written:], offset + nb_written
+    else:
+        with lock:
+            f.seek(offset)
+            f.write(block)
 
-    if "bar" in hookdata:
-        hookdata["bar"].close()
 
-    if res is None:
+def _url_fetch_ranges(url, f, size, nb_chunks, retry, headers, hook):
+    chunk_size = -(-size // nb_chunks)
+    ranges = [
+        (start, min(start + chunk_size, size) - 1)
+        for start in range(0, size, chunk_size)
+    ]
+    bufsize = _bufsize(size)
+    lock = threading.Lock()
+    progress = {"nb_bytes": 0}
+    # Set when a range fails, so that the other workers stop writing
+    # before the caller (maybe) falls back to a single-stream download.
+    abort = threading.Event()
+
+    def fetch(byte_range):
+        start, stop = byte_range
+        exc = None
+        for attempt in range(retry):
+            if abort.is_set():
+                return
+            if attempt:
+                _retry_wait(attempt - 1, exc)
+            try:
+                range_headers = dict(headers or {})
+                range_headers["Range"] = f"bytes={start}-{stop}"
+                with url_open(url, range_headers) as res:
+                    if res.status != 206:
+                        raise _RangesNotSupported(url)
+                    while start <= stop:
+                        if abort.is_set():
+                            return
+                        block = res.read(min(bufsize, stop - start + 1))
+                        if not block:
+                            raise http.client.IncompleteRead(b"")
+                        _pwrite(f, block, start, lock)
+                        start += len(block)
+                        with lock:
+                            progress["nb_bytes"] += len(block)
+                            if hook:
+                                hook(progress["nb_bytes"], size)
+                return
+            except _RangesNotSupported:
+                raise
+            except Exception as e:
+                # Retry from the last byte written
+                exc = e
         raise DownloadError(str(exc))
 
-    return out
+    with ThreadPoolExecutor(len(ranges)) as pool:
+        futures = [pool.submit(fetch, byte_range) for byte_range in ranges]
+        try:
+            # Return as soon as any range fails, rather than after all
+            # those submitted before it have completed.
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+        except BaseException:
+            abort.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
 
 
 _HOMEBREW_VERSIONS = {"openssl": "3.4.1"}
@@ -213,44 +768,92 @@ _HOMEBREW_DIGESTS = {
 }
 
 
-def download_bottle(package, version=None, digest=None, variant=None, out="."):
-    # Download a Homebrew bottle (= build package)
-    headers = (
-        ("Authorization", "Bearer QQ=="),
-        ("Accept", "application/vnd.oci.image.layer.v1.tar+gzip"),
-    )
-    opener = request.build_opener()
-    opener.addheaders = headers
-    request.install_opener(opener)
+_HOMEBREW_HEADERS = {
+    "Authorization": "Bearer QQ==",
+    "Accept": "application/vnd.oci.image.layer.v1.tar+gzip",
+}
 
-    try:
-        arch = guess_arch()
-        macver = macos_version()[0]
-        version = version or _HOMEBREW_VERSIONS[package]
-        if not digest:
-            digesters = _HOMEBREW_DIGESTS[package][version][arch]
-            if macver not in digesters:
-                if macver < min(digesters):
-                    digest = digesters[min(digesters)]
-                elif macver > max(digesters):
-                    digest = digesters[max(digesters)]
-                else:
-                    assert False
-            else:
-                digest = digesters[macver]
 
-        if variant:
-            package_path = f"{package}/{variant}"
+def bottle_url(package, version=None, digest=None, variant=None):
+    # URL of a Homebrew bottle (= build package)
+    arch = guess_arch()
+    macver = macos_version()[0]
+    version = version or _HOMEBREW_VERSIONS[package]
+    if not digest:
+        digesters = _HOMEBREW_DIGESTS[package][version][arch]
+        if macver not in digesters:
+            if macver < min(digesters):
+                digest = digesters[min(digesters)]
+            elif macver > max(digesters):
+                digest = digesters[max(digesters)]
+            else:
+                assert False
         else:
-            package_path = package
-        url = f"https://ghcr.io/v2/homebrew/core/{package_path}/blobs/sha256:{digest}"  # noqa: E501
-        name = f"{package}-{version}.bottle.tar.gz"
-        if op.isdir(out):
-            out = op.join(out, name)
-        return url_download(url, out)
+            digest = digesters[macver]
+
+    if variant:
+        package_path = f"{package}/{variant}"
+    else:
+        package_path = package
+    return f"https://ghcr.io/v2/homebrew/core/{package_path}/blobs/sha256:{digest}"  # noqa: E501
 
-    finally:
-        request.install_opener(None)
+
+def open_bottle(package, version=None, digest=None, variant=None):
+    # Open a Homebrew bottle (= build package) as a stream, so that it
+    # can be decompressed while it is being downloaded.
+    url = bottle_url(package, version, digest, variant)
+    return url_open(url, _HOMEBREW_HEADERS)
+
+
+def download_bottle(package, version=None, digest=None, variant=None, out="."):
+    # Download a Homebrew bottle (= build package)
+    version = version or _HOMEBREW_VERSIONS[package]
+    url = bottle_url(package, version, digest, variant)
+    name = f"{package}-{version}.bottle.tar.gz"
+    if op.isdir(out):
+        out = op.join(out, name)
+    return url_download(url, out, headers=_HOMEBREW_HEADERS)
+
+
+def extract_bottle_member(
+    package, name, out, version=None, digest=None, variant=None
+):
+    # Extract a single file from a Homebrew bottle (= build package).
+    # `name` is relative to the bottle root (e.g., "lib/libcrypto.3.dylib").
+    # The bottle is streamed through the decompressor, the file is copied
+    # straight to `out`, and reading stops as soon as it has been copied,
+    # so that nothing else in the bottle is written (or even downloaded).
+    # If `name` is a symlink, the link is followed within the bottle; if
+    # its target was already streamed past, the bottle is read again.
+    version = version or _HOMEBREW_VERSIONS[package]
+    root = f"{package}@{variant}" if variant else package
+    wanted = f"{root}/{version}/{name}"
+
+    opt = dict(bufsize=_COPY_BUFSIZE, copybufsize=_COPY_BUFSIZE)
+    for _ in range(8):
+        seen = set()
+        with open_bottle(package, version, digest, variant) as res:
+            with tarfile.open(fileobj=res, mode="r|gz", **opt) as f:
+                for member in f:
+                    seen.add(member.name)
+                    if member.name != wanted:
+                        continue
+                    if member.issym():
+                        wanted = posixpath.normpath(posixpath.join(
+                            posixpath.dirname(member.name), member.linkname
+                        ))
+                        if wanted in seen:
+                            break
+                        continue
+                    with f.extractfile(member) as src, \
+                         open(out, "wb") as dst:
+                        shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+                    os.chmod(out, member.mode)
+                    return out
+                else:
+                    break
+
+    raise FileNotFoundError(f"{wanted} not found in bottle")
 
 
 def patch_libcrypto(matlab_path):
@@ -258,18 +861,11 @@ def patch_libcrypto(matlab_path):
     arch = guess_arch()
     libcrypto_path = op.join(matlab_path, "bin", arch, "libcrypto.3.dylib")
 
-    version = _HOMEBREW_VERSIONS["openssl"]
-
     shutil.move(libcrypto_path, libcrypto_path + ".tmp", )
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            gzipfile = download_bottle("openssl", variant="3", out=tmpdir)
-            with tarfile.open(gzipfile, "r:gz") as f:
-                f.extractall(tmpdir)
-            libcrypto_path_new = op.join(
-                tmpdir, "openssl@3", version, "lib", "libcrypto.3.dylib"
-            )
-            shutil.move(libcrypto_path_new, libcrypto_path)
+        extract_bottle_member(
+            "openssl", "lib/libcrypto.3.dylib", libcrypto_path, variant="3"
+        )
 
     except Exception as e:
         shutil.move(libcrypto_path + ".tmp", libcrypto_path)
@@ -278,7 +874,7 @@ def patch_libcrypto(matlab_path):
 
 def patch_runtime(matlab_path):
     arch = guess_arch()
-    if arch[:3] == "mac":
+    if arch.is_mac:
         patch_libcrypto(matlab_path)
 
 
@@ -287,19 +883,36 @@ def patch_runtime(matlab_path):
 # ----------------------------------------------------------------------
 
 
+class Arch(str):
+    """
+    MATLAB architecture name (e.g. "maca64"), with flags telling which
+    operating system it targets.
+    """
+
+    def __new__(cls, arch):
+        self = super().__new__(cls, arch)
+        self.is_win = arch[:3] == "win"
+        self.is_mac = arch[:3] == "mac"
+        self.is_linux = arch[:3] == "gln"
+        return self
+
+
+@functools.lru_cache(maxsize=None)
 def guess_arch():
 
-    try:
-        arch = {
-            "Darwin": "mac",
-            "Windows": "win",
-            "Linux": "glnx",
-        }[platform.system()]
-    except KeyError:
+    # `sys.platform` and `platform.machine` are cheap, whereas some
+    # `platform` functions spawn subprocesses on some systems.
+    if sys.platform == "darwin":
+        arch = "mac"
+    elif sys.platform == "win32":
+        arch = "win"
+    elif sys.platform.startswith("linux"):
+        arch = "glnx"
+    else:
         raise UnsupportedArchError(sys.platform)
 
     if arch == "mac":
-        if platform.processor() == "arm":
+        if platform.machine().lower().startswith(("arm", "aarch")):
             arch += "a"
         else:
             arch += "i"
@@ -315,11 +928,12 @@ def guess_arch():
         else:
             arch += "86"
 
-    return arch
+    return Arch(arch)
 
 
+@functools.lru_cache(maxsize=None)
 def macos_version():
-    ver = platform.platform().split("-")[1]
+    ver = platform.mac_ver()[0]
     ver = tuple(map(int, ver.split(".")))
     return ver
 
@@ -338,11 +952,15 @@ CANDIDATE_LOCATIONS_BY_OS = {
     "mac": [
         "/Applications/MATLAB/MATLAB_Runtime/{release}",
         "/Applications/MATLAB_{release}.app",
+        "/Applications/MATLAB_{release}",
         "/Applications/MATLAB/{release}"
     ]
 }
 
 
+_RELEASE_RE = re.compile(r"R\d{4}[ab]")
+
+
 def iter_existing_installations(variant='latest_installed'):
     """
     Iterate over MATLAB and MATLAB Runtime installations in common location.
@@ -364,29 +982,38 @@ def iter_existing_installations(variant='latest_installed'):
     if os.environ.get("MATLAB_RUNTIME_PATH", ""):
         yield (os.environ["MATLAB_RUNTIME_PATH"], variant)
 
-    import re
-    import glob
-
     if variant == "latest_installed":
-        pattern = re.compile(r"R\d{4}[ab]")
+        pattern = _RELEASE_RE
     else:
         pattern = re.compile(variant)
 
     paths = []
     for base in bases:
+        # Scan the parent directory once, and match entry names against
+        # the template (e.g., "MATLAB_{release}.app").
+        parent, name = op.split(base)
+        head, tail = name.split("{release}")
         try:
-            for path in glob.glob(base.format(release="*")):
-                search = re.search(pattern, path)
-                if search:
-                    paths.append((base, path, search.group()))
-        except FileNotFoundError:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith(head) and name.endswith(tail)):
+                        continue
+                    release = name[len(head):len(name)-len(tail)]
+                    search = pattern.search(release)
+                    if search and entry.is_dir():
+                        paths.append((base, entry.path, search.group()))
+        except (FileNotFoundError, NotADirectoryError):
             continue
 
     def sort_paths(path_tuple):
         return (path_tuple[2], bases[::-1].index(path_tuple[0]))
 
+    seen = set()
     for _, path, ver in sorted(paths, reverse=True, key=sort_paths):
-        yield path, ver
+        if path not in seen:
+            seen.add(path)
+            yield path, ver
 
 
 def guess_prefix():
@@ -407,13 +1034,17 @@ def guess_prefix():
     """
     if os.environ.get("MATLAB_RUNTIME_PATH", ""):
         return os.environ["MATLAB_RUNTIME_PATH"]
+    return _default_prefix()
 
+
+@functools.lru_cache(maxsize=None)
+def _default_prefix():
     arch = guess_arch()
-    if arch[:3] == "win":
+    if arch.is_win:
         return "C:\\Program Files\\MATLAB\\MATLAB Runtime\\"
-    if arch[:3] == "gln":
+    if arch.is_linux:
         return "/usr/local/MATLAB/MATLAB_Runtime"
-    if arch[:3] == "mac":
+    if arch.is_mac:
         return "/Applications/MATLAB/MATLAB_Runtime"
     assert False
 
@@ -428,8 +1059,9 @@ def find_runtime(version, prefix=None):
     # Check under prefix
     if prefix is None:
         prefix = guess_prefix()
-    if op.exists(op.join(prefix, version, version_info)):
-        return op.join(prefix, version)
+    path = op.join(prefix, version)
+    if op.exists(op.join(path, version_info)):
+        return path
 
     # Check if MATLAB_PATH is set
     if os.environ.get("MATLAB_PATH", ""):
@@ -438,29 +1070,21 @@ def find_runtime(version, prefix=None):
             return path
 
     # Look for other known locations
+    # (This order differs from CANDIDATE_LOCATIONS_BY_OS on Windows, and
+    # decides which runtime is used when several are installed.)
     arch = guess_arch()
-    if arch[:3] == "win":
+    if arch.is_win:
         bases = [
             "C:\\Program Files (x86)\\MATLAB\\MATLAB Runtime\\{release}",
             "C:\\Program Files\\MATLAB\\MATLAB Runtime\\{release}",
             "C:\\Program Files\\MATLAB\\{release}",
             "C:\\Program Files (x86)\\MATLAB\\{release}"
         ]
-    elif arch[:3] == "gln":
-        bases = [
-            "/usr/local/MATLAB/MATLAB_Runtime/{release}",
-            "/usr/local/MATLAB/{release}"
-        ]
-    elif arch[:3] == "mac":
-        bases = [
-            "/Applications/MATLAB/MATLAB_Runtime/{release}",
-            "/Applications/MATLAB_{release}.app",
-            "/Applications/MATLAB_{release}",
-            "/Applications/MATLAB/{release}"
-        ]
+    else:
+        bases = CANDIDATE_LOCATIONS_BY_OS[arch[:3]]
     for base in bases:
         base = base.format(release=version)
-        if op.exists(op.join(base, "VersionInfo.xml")):
+        if op.exists(op.join(base, version_info)):
             return base
 
     # Check whether a matlab binary is on the path
@@ -504,22 +1128,40 @@ def guess_matlab_release(path):
     return _guess_matlab_version(path, "release")
 
 
+# VersionInfo.xml is a tiny file with a known schema, so its fields are
+# read with regexes rather than by building an XML tree.
+_VERSIONINFO_RE = {
+    key: re.compile(rf"<{key}>\s*([^<]*?)\s*</{key}>")
+    for key in ("version", "release")
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_versioninfo(path):
+    # Parse VersionInfo.xml once, for both its version and release
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    info = {}
+    for key, regex in _VERSIONINFO_RE.items():
+        match = regex.search(text)
+        if not match:
+            raise ValueError(f"No {key} found in {path}")
+        info[key] = match[1]
+    return info
+
+
+@functools.lru_cache(maxsize=None)
 def _guess_matlab_version(path, key):
-    path0, path = path, op.abspath(op.realpath(path))
-    trial = 0
-    while path:
-        if trial > 100:
+    # Walk up the (absolute) path until VersionInfo.xml is found, or the
+    # root is reached.
+    path0, path = path, op.realpath(path)
+    for _ in range(100):
+        versioninfo = op.join(path, 'VersionInfo.xml')
+        if op.isfile(versioninfo):
+            return _parse_versioninfo(versioninfo)[key]
+        path, prev_path = op.dirname(path), path
+        if path == prev_path:
             break
-        trial += 1
-        if op.exists(op.join(path, 'VersionInfo.xml')):
-            path = op.join(path, 'VersionInfo.xml')
-            tree = ElementTree.parse(path)
-            version = tree.find(key).text
-            return version
-        else:
-            path, prev_path = op.dirname(path), path
-            if path in (prev_path, ''):
-                break
     raise ValueError(
         f"Could not guess matlab {key} from python module. "
         f"Path: {path0}"
@@ -534,33 +1176,43 @@ def _guess_matlab_version(path, key):
 def matlab_release(version):
     """Convert MATLAB version (e.g. 24.2) to release (e.g. R2024b)."""
     if isinstance(version, (list, tuple)):
-        version = ".".join(map(str(version[:2])))
+        version = ".".join(map(str, version[:2]))
+    return _matlab_release(version)
+
+
+@functools.lru_cache(maxsize=None)
+def _matlab_release(version):
     if version[:1] == "R":
         return version
-    if version in VERSION_TO_RELEASE:
-        return VERSION_TO_RELEASE[version]
     year, release, *_ = version.split(".")
-    return "R20" + year + ("abcdefghijklmnopqrstuvwxy"[int(release)+1])
+    # Since R2023b (23.2), versions follow the release: no need to
+    # load the table of known versions.
+    if int(year) < 23 and version in VERSION_TO_RELEASE:
+        return VERSION_TO_RELEASE[version]
+    return f"R20{year}{chr(ord('a') + int(release) - 1)}"
 
 
 def matlab_version(version):
     """Convert MATLAB release (e.g. R2024b) to version (e.g. 24.2)."""
-    # 1. look for version in dict of known versions
     if isinstance(version, (list, tuple)):
-        version = ".".join(map(str(version[:2])))
-    for runtime_version, matlab_version in VERSION_TO_RELEASE.items():
-        if version in (runtime_version, matlab_version):
-            return runtime_version
-    # 2. if does not look like a matlab version, hope it's a runtime version
+        version = ".".join(map(str, version[:2]))
+    # 1. if does not look like a matlab release, it is already a version
     if version[:1] != "R":
         return version
-    # 3. convert matlab version to runtime version using new scheme
+    # 2. look for release in dict of known releases (the new scheme
+    #    applies since R2023b, so no need to load the dict for these)
+    if version < "R2023b" and version in RELEASE_TO_VERSION:
+        return RELEASE_TO_VERSION[version]
+    # 3. convert matlab release to runtime version using new scheme
     year, letter = version[3:5], version[5]
-    return year + "." + str("abcdefghijklmnopqrstuvwxy".index(letter) + 1)
+    return f"{year}.{ord(letter) - ord('a') + 1}"
 
 
 def guess_release(version, arch=None, prefix=None):
     """Guess version (if "latest") + convert to MATLAB release (e.g. R2024b)"""
+    if isinstance(version, str) and _RELEASE_RE.fullmatch(version):
+        return version
+
     arch = arch or guess_arch()
 
     if version.lower() == "latest_installed":
@@ -574,25 +1226,48 @@ def guess_release(version, arch=None, prefix=None):
         return guess_release("latest", arch)
 
     elif version.lower() == "latest":
+        version = _latest_release()
 
-        # Find most recent version
-        year = datetime.now().year
-        while year >= 2012:
-            for letter in ("b", "a"):
-                maybe_version = "R" + str(year) + letter
-                try:
-                    guess_installer(maybe_version)
-                    version = maybe_version
-                    break
-                except VersionNotFoundError:
-                    continue
-            if version.lower() != "latest":
-                break
-            year -= 1
+    return matlab_release(version)
 
-        assert version.lower() != "latest", "Could not find any version ???"
 
-    return matlab_release(version)
+# Probing the server for the most recent release is costly, and its
+# answer does not change during the lifetime of the process.
+# (Unlike "latest_installed", which depends on what has been installed
+# since, and is therefore not cached).
+@functools.lru_cache(maxsize=None)
+def _latest_release():
+    def exists(release):
+        try:
+            guess_installer(release)
+            return True
+        except VersionNotFoundError:
+            return False
+        except DownloadError:
+            # Probes timed out: the release may or may not exist
+            return None
+
+    # Find most recent version. The releases of this year and the
+    # previous one are probed concurrently, since the current year's
+    # are often not out yet.
+    year = datetime.now().year
+    while year >= 2012:
+        releases = [
+            "R" + str(year - i) + letter
+            for i in (0, 1) for letter in ("b", "a")
+        ]
+        with ThreadPoolExecutor(len(releases)) as pool:
+            found = list(pool.map(exists, releases))
+        for release, ok in zip(releases, found):
+            if ok is None:
+                raise DownloadError(
+                    f"Could not check whether {release} exists"
+                )
+            if ok:
+                return release
+        year -= 2
+
+    raise AssertionError("Could not find any version ???")
 
 
 # ----------------------------------------------------------------------
@@ -636,6 +1311,114 @@ TEMPLATE1 = (
 #   We need this installer to be able to pass command line arguments.
 
 
+# Installer URLs found by probing the server are remembered across runs
+CACHE_DIR = op.join(
+    os.environ.get("XDG_CACHE_HOME") or op.join(op.expanduser("~"), ".cache"),
+    "matlab_runtime_installer",
+)
+_INSTALLERS_CACHE = op.join(CACHE_DIR, "installers.json")
+_INSTALLERS_CACHE_TTL = 30 * 24 * 60 * 60    # 30 days
+
+
+def _load_installers_cache():
+    try:
+        with open(_INSTALLERS_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_cached_installer(arch, release):
+    entry = _load_installers_cache().get(arch, {}).get(release)
+    if entry and time.time() - entry["time"] < _INSTALLERS_CACHE_TTL:
+        return entry["url"]
+    return None
+
+
+# Releases may be probed from concurrent threads
+_INSTALLERS_CACHE_LOCK = threading.Lock()
+
+
+def _set_cached_installer(arch, release, url):
+    with _INSTALLERS_CACHE_LOCK:
+        cache = _load_installers_cache()
+        entry = {"url": url, "time": time.time()}
+        cache.setdefault(arch, {})[release] = entry
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Write to a temporary file and move it in place, so that
+            # other processes never read a partially written cache.
+            fd, tmp = tempfile.mkstemp(".json", dir=CACHE_DIR)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(cache, f, indent=4)
+                os.replace(tmp, _INSTALLERS_CACHE)
+            finally:
+                if op.exists(tmp):
+                    os.remove(tmp)
+        except OSError:
+            # The cache is only an optimization
+            pass
+
+
+_DOWNLOADS_CACHE = op.join(CACHE_DIR, "downloads")
+
+
+def download_installer(url, out):
+    """
+    Download an installer, unless it was already downloaded.
+
+    Installers are kept in the user cache
+    (`$XDG_CACHE_HOME/matlab_runtime_installer/downloads`, which
+    defaults to `~/.cache/matlab_runtime_installer/downloads`), so that
+    reinstalling a version does not download it again. A cached
+    installer is downloaded again if the remote file was modified or
+    does not have the same size.
+
+    If the environment variable `"MATLAB_RUNTIME_NO_CACHE"` is set, or
+    if the cache is not writable, the installer is downloaded into
+    `out` instead.
+
+    Parameters
+    ----------
+    url : str
+        Installer URL.
+    out : str
+        Fallback output directory.
+
+    Returns
+    -------
+    path : str
+        Path to the downloaded installer.
+    """
+    if os.environ.get("MATLAB_RUNTIME_NO_CACHE", ""):
+        return url_download(url, out)
+
+    key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    basename = op.basename(parse.urlparse(url).path)
+    path = op.join(_DOWNLOADS_CACHE, f"{key}-{basename}")
+
+    try:
+        os.makedirs(_DOWNLOADS_CACHE, exist_ok=True)
+    except OSError:
+        pass
+    if not os.access(_DOWNLOADS_CACHE, os.W_OK):
+        return url_download(url, out)
+
+    # A cached installer whose size differs from the remote one is
+    # corrupted, and must not be kept because of its modification date.
+    if op.exists(path):
+        size = _url_size(url)
+        if size >= 0 and size != op.getsize(path):
+            print("Cached installer is corrupted:", path)
+            os.remove(path)
+
+    # `url_download` only moves the file in place once complete, so an
+    # interrupted download is never mistaken for a cached installer,
+    # and it only downloads it again if the remote file was modified.
+    return url_download(url, path)
+
+
 def guess_installer(release, arch=None, max_update=10):
     """Find installer URL from version or release, for an arch."""
     A = arch or guess_arch()
@@ -646,7 +1429,15 @@ def guess_installer(release, arch=None, max_update=10):
     if R in INSTALLERS[A]:
         return INSTALLERS[A][R]
 
+    url = _get_cached_installer(A, R)
+    if url:
+        INSTALLERS[A][R] = url
+        return url
+
     U = RELEASE_TO_UPDATE.get(R, "0")
+    # Set if some probes timed out, in which case a more recent update
+    # may exist, and the answer must not be remembered.
+    inconclusive = False
 
     def not_available():
         raise VersionNotFoundError(
@@ -658,24 +1449,34 @@ def guess_installer(release, arch=None, max_update=10):
         return TEMPLATE1.format(release=R, arch=A, ext=E)
 
     def url2():
-        # We know that this installer exists
-        tpl = TEMPLATE2_UPDATE if U != "0" else TEMPLATE2
-        url = tpl.format(release=R, update=U, arch=A, ext=E)
-        if not url_exists(url):
+        nonlocal inconclusive
+
+        def url(update):
+            tpl = TEMPLATE2_UPDATE if update else TEMPLATE2
+            return tpl.format(release=R, update=update, arch=A, ext=E)
+
+        # The installer for update U of a known release exists: only
+        # probe the `max_update` next updates. Otherwise, probe it along
+        # with the next ones. Probes are sent concurrently, and the most
+        # recent update available is kept.
+        known = R in RELEASE_TO_UPDATE
+        first = int(U) + known
+        updates = range(first, first + max_update)
+        with ThreadPoolExecutor(len(updates)) as pool:
+            available = list(pool.map(url_exists, map(url, updates)))
+        if not known and not available[0]:
+            if available[0] is None:
+                raise DownloadError(
+                    f"Could not check whether {url(first)} exists"
+                )
             not_available()
 
-        # Try to find a more recent update if possible
-        maybe_u = int(U)
-        while True:
-            maybe_u += 1
-            tpl = TEMPLATE2_UPDATE
-            maybe_url = tpl.format(release=R, update=maybe_u, arch=A, ext=E)
-            if url_exists(maybe_url):
-                url = maybe_url
-            else:
-                break
-
-        return url
+        found = [u for u, ok in zip(updates, available) if ok]
+        latest = max(found, default=int(U))
+        inconclusive = any(
+            ok is None for u, ok in zip(updates, available) if u > latest
+        )
+        return url(latest)
 
     if A == "win64":
         if Y < 12:
@@ -723,6 +1524,9 @@ def guess_installer(release, arch=None, max_update=10):
     else:
         raise ValueError(f"Arch not supported: {A}")
 
+    if inconclusive:
+        return INSTALLERS[A].pop(R)
+    _set_cached_installer(A, R, INSTALLERS[A][R])
     return INSTALLERS[A][R]
 
 
@@ -743,13 +1547,53 @@ def _get_matlab_info_from_file():
         return json.load(content)
 
 
-try:
-    info = _get_matlab_info_from_web()
-    VERSION_TO_RELEASE = info["VERSION_TO_RELEASE"]
-    SUPPORTED_PYTHON_VERSIONS = info["SUPPORTED_PYTHON_VERSIONS"]
-    RELEASE_TO_UPDATE = info["RELEASE_TO_UPDATE"]
-except Exception:
-    info = _get_matlab_info_from_file()
-    VERSION_TO_RELEASE = info["VERSION_TO_RELEASE"]
-    SUPPORTED_PYTHON_VERSIONS = info["SUPPORTED_PYTHON_VERSIONS"]
-    RELEASE_TO_UPDATE = info["RELEASE_TO_UPDATE"]
+@functools.lru_cache(maxsize=None)
+def _get_matlab_info():
+    try:
+        return _get_matlab_info_from_web()
+    except Exception:
+        return _get_matlab_info_from_file()
+
+
+class _MatlabInfoTable(Mapping):
+    # Read-only view of a table from info.json, which is only fetched
+    # the first time one of the tables is accessed, so that importing
+    # the package does not wait on the network. `convert` optionally
+    # transforms the table once it is loaded.
+
+    def __init__(self, key, convert=None):
+        self._key = key
+        self._convert = convert
+        self._data = None
+
+    @property
+    def _table(self):
+        if self._data is None:
+            table = _get_matlab_info()[self._key]
+            if self._convert:
+                table = self._convert(table)
+            self._data = table
+        return self._data
+
+    def __getitem__(self, key):
+        return self._table[key]
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __len__(self):
+        return len(self._table)
+
+    def __repr__(self):
+        return repr(self._table)
+
+
+VERSION_TO_RELEASE = _MatlabInfoTable("VERSION_TO_RELEASE")
+RELEASE_TO_VERSION = _MatlabInfoTable(
+    "VERSION_TO_RELEASE", lambda x: {v: k for k, v in x.items()}
+)
+SUPPORTED_PYTHON_VERSIONS = _MatlabInfoTable(
+    "SUPPORTED_PYTHON_VERSIONS",
+    lambda x: {k: frozenset(v) for k, v in x.items()}
+)
+RELEASE_TO_UPDATE = _MatlabInfoTable("RELEASE_TO_UPDATE")
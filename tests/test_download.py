@@ -0,0 +1,282 @@
+import email.utils
+import http.server
+import os
+import re
+import socket
+import threading
+import time
+
+import pytest
+
+from matlab_runtime import utils
+from matlab_runtime.utils import (
+    DownloadError,
+    download_installer,
+    url_download,
+)
+
+DATA = os.urandom(1024 * 1024)
+MTIME = int(time.time()) - 3600
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    # Serves DATA at /file, with knobs (set on the server) to misbehave
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.respond()
+
+    def do_GET(self):
+        self.respond()
+
+    def send(self, status, body=b"", headers=(), truncate=False):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header(
+            "Last-Modified", email.utils.formatdate(MTIME, usegmt=True)
+        )
+        if self.server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        for key, value in headers:
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command == "GET":
+            if truncate:
+                # Close the connection half way through the body
+                self.close_connection = True
+                body = body[:len(body) // 2]
+            self.wfile.write(body)
+
+    def respond(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, dict(self.headers)))
+        if self.path == "/redirect":
+            return self.send(302, headers=[("Location", "/file")])
+        if self.path != "/file":
+            return self.send(404)
+        since = self.headers.get("If-Modified-Since")
+        if since and server.honour_since:
+            if email.utils.parsedate_to_datetime(since).timestamp() >= MTIME:
+                return self.send(304)
+        if self.command == "GET" and server.errors:
+            return self.send(server.errors.pop(0))
+
+        byte_range = self.headers.get("Range")
+        if byte_range and server.honour_ranges:
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", byte_range)
+            start = int(match[1])
+            stop = int(match[2] or len(DATA) - 1)
+            if start >= server.fail_ranges_from:
+                return self.send(200, DATA)
+            content_range = f"bytes {start}-{stop}/{len(DATA)}"
+            return self.send(
+                206, DATA[start:stop + 1], [("Content-Range", content_range)]
+            )
+        truncate = self.command == "GET" and server.truncate > 0
+        server.truncate -= truncate
+        return self.send(200, DATA, truncate=truncate)
+
+
+@pytest.fixture
+def server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    server.accept_ranges = True
+    server.honour_ranges = True
+    server.fail_ranges_from = len(DATA)
+    server.honour_since = True
+    server.errors = []
+    server.truncate = 0
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(
+        target=server.serve_forever, args=(0.05,), daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _gets(server):
+    return [headers for method, headers in server.requests if method == "GET"]
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(utils, "_RETRY_BACKOFF", 0)
+
+
+@pytest.fixture
+def ranged(monkeypatch):
+    # Download DATA in ranges, although it is small
+    monkeypatch.setattr(utils, "_PARALLEL_DOWNLOAD_THRESHOLD", 1)
+
+
+def test_url_download(server, tmp_path):
+    out = url_download(server.url + "/file", str(tmp_path), verbose=False)
+    assert out == str(tmp_path / "file")
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+    assert os.listdir(tmp_path) == ["file"]
+    if os.name == "posix":
+        mode = os.stat(out).st_mode & 0o777
+        assert mode == 0o666 & ~utils._get_umask()
+
+
+def test_url_download_redirect(server, tmp_path):
+    out = url_download(
+        server.url + "/redirect", str(tmp_path / "a.zip"), verbose=False
+    )
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+
+
+def test_url_download_missing(server, tmp_path):
+    with pytest.raises(DownloadError):
+        url_download(server.url + "/missing", str(tmp_path), verbose=False)
+    assert os.listdir(tmp_path) == []
+
+
+def test_url_download_ranges(server, tmp_path, ranged):
+    out = url_download(
+        server.url + "/file", str(tmp_path), verbose=False, nb_chunks=4
+    )
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+    assert len(_gets(server)) == 4
+    assert all("Range" in headers for headers in _gets(server))
+
+
+def test_url_download_ranges_ignored(server, tmp_path, ranged):
+    # Ranges advertised, but the server answers 200 to all of them
+    server.honour_ranges = False
+    out = url_download(
+        server.url + "/file", str(tmp_path), verbose=False, nb_chunks=4
+    )
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+    assert "Range" not in _gets(server)[-1]
+
+
+def test_url_download_range_fails(server, tmp_path, ranged):
+    # Only the last range is refused: the others are stopped, and the
+    # file is downloaded again over a single connection.
+    server.fail_ranges_from = len(DATA) - len(DATA) // 4
+    out = url_download(
+        server.url + "/file", str(tmp_path), verbose=False, nb_chunks=4
+    )
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+    assert "Range" not in _gets(server)[-1]
+    assert os.listdir(tmp_path) == ["file"]
+
+
+def test_url_download_resume(server, tmp_path, no_backoff):
+    server.truncate = 1
+    out = url_download(server.url + "/file", str(tmp_path), verbose=False)
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+    assert _gets(server)[-1]["Range"] == f"bytes={len(DATA) // 2}-"
+
+
+def test_url_download_resume_ignored(server, tmp_path, no_backoff):
+    # The server ignores the range: the download starts over
+    server.truncate = 1
+    server.honour_ranges = False
+    out = url_download(server.url + "/file", str(tmp_path), verbose=False)
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+    assert len(_gets(server)) == 2
+
+
+def test_url_download_retry(server, tmp_path, no_backoff):
+    server.errors = [503, 502]
+    out = url_download(server.url + "/file", str(tmp_path), verbose=False)
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+    assert len(_gets(server)) == 3
+
+
+def test_url_download_no_retry(server, tmp_path, no_backoff):
+    # Client errors are not worth retrying
+    server.errors = [403]
+    with pytest.raises(DownloadError):
+        url_download(server.url + "/file", str(tmp_path), verbose=False)
+    assert len(_gets(server)) == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_url_download_not_modified(server, tmp_path):
+    out = url_download(server.url + "/file", str(tmp_path), verbose=False)
+    mtime = os.path.getmtime(out)
+    url_download(server.url + "/file", str(tmp_path), verbose=False)
+    assert len(_gets(server)) == 1
+    assert "If-Modified-Since" in server.requests[-1][1]
+    assert os.path.getmtime(out) == mtime
+
+    # Local file older than the remote one: download it again
+    os.utime(out, (0, 0))
+    url_download(server.url + "/file", str(tmp_path), verbose=False)
+    assert len(_gets(server)) == 2
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+
+
+def test_url_download_since_ignored(server, tmp_path):
+    # The server answers 200 to If-Modified-Since, but the date and
+    # size of the local file match the remote ones.
+    server.honour_since = False
+    out = url_download(server.url + "/file", str(tmp_path), verbose=False)
+    url_download(server.url + "/file", str(tmp_path), verbose=False)
+    assert len(_gets(server)) == 1
+
+    with open(out, "r+b") as f:
+        f.truncate(10)
+    url_download(server.url + "/file", str(tmp_path), verbose=False)
+    assert len(_gets(server)) == 2
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+
+
+def test_url_download_offline(server, tmp_path):
+    out = url_download(server.url + "/file", str(tmp_path), verbose=False)
+    # Nothing listens on this port anymore
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        offline = "http://127.0.0.1:%d" % sock.getsockname()[1]
+    assert url_download(offline + "/file", out, verbose=False) == out
+    with open(out, "rb") as f:
+        assert f.read() == DATA
+
+
+def test_download_installer(server, tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    out = tmp_path / "out"
+    out.mkdir()
+    monkeypatch.setattr(utils, "_DOWNLOADS_CACHE", str(cache))
+    monkeypatch.delenv("MATLAB_RUNTIME_NO_CACHE", raising=False)
+
+    path = download_installer(server.url + "/file", str(out))
+    assert os.path.dirname(path) == str(cache)
+    assert download_installer(server.url + "/file", str(out)) == path
+    assert len(_gets(server)) == 1
+    assert os.listdir(out) == []
+
+    # A truncated installer is downloaded again, although more recent
+    with open(path, "r+b") as f:
+        f.truncate(10)
+    download_installer(server.url + "/file", str(out))
+    assert len(_gets(server)) == 2
+    with open(path, "rb") as f:
+        assert f.read() == DATA
+
+    monkeypatch.setenv("MATLAB_RUNTIME_NO_CACHE", "1")
+    path = download_installer(server.url + "/file", str(out))
+    assert os.path.dirname(path) == str(out)
@@ -1,6 +1,8 @@
 import os.path as op
 from tempfile import gettempdir
 
+import pytest
+
 from matlab_runtime import install, guess_arch, guess_prefix
 
 if guess_arch()[:3] == "mac":
@@ -11,5 +13,8 @@ else:
     tmp_prefix = op.join(gettempdir(), "MATLAB", "MATLAB_Runtime")
 
 
-def test_install_r2024b():
-    install("R2024b", prefix=tmp_prefix, auto_answer=True)
+# Each release is installed in its own subdirectory of the prefix,
+# which `test_import` relies on, so the prefix is shared.
+@pytest.mark.parametrize("release", ["R2024b"])
+def test_install(release):
+    install(release, prefix=tmp_prefix, auto_answer=True)
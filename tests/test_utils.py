@@ -0,0 +1,41 @@
+import builtins
+
+import pytest
+
+from matlab_runtime.utils import (
+    askuser,
+    matlab_release,
+    matlab_version,
+    UserInterruptionError,
+)
+
+
+def test_matlab_release():
+    assert matlab_release("R2024b") == "R2024b"
+    assert matlab_release("9.13") == "R2022b"
+    assert matlab_release("24.2") == "R2024b"
+    assert matlab_release("25.1") == "R2025a"
+    assert matlab_release((24, 1)) == "R2024a"
+
+
+def test_matlab_version():
+    assert matlab_version("R2022b") == "9.13"
+    assert matlab_version("R2024b") == "24.2"
+    assert matlab_version((24, 2)) == "24.2"
+
+
+def test_askuser(monkeypatch):
+    assert askuser("?", "yes", auto_answer=True)
+    assert not askuser("?", "no", auto_answer=True)
+    with pytest.raises(UserInterruptionError):
+        askuser("?", "no", auto_answer=True, raise_if_no=True)
+
+    for answer, default, expected in [
+        ("", "yes", True),
+        ("", "no", False),
+        ("Yes", "no", True),
+        ("n", "yes", False),
+        ("whatever", "yes", False),
+    ]:
+        monkeypatch.setattr(builtins, "input", lambda _: answer)
+        assert askuser("?", default) is expected
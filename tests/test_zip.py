@@ -0,0 +1,66 @@
+import os
+import os.path as op
+import stat
+import sys
+import threading
+import zipfile
+
+import pytest
+
+from matlab_runtime.utils import ZipFileWithExecPerm
+
+
+def _zipinfo(name, mode):
+    info = zipfile.ZipInfo(name)
+    info.external_attr = mode << 16
+    return info
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zip:
+        zip.writestr(_zipinfo("bin/", stat.S_IFDIR | 0o755), "")
+        zip.writestr(_zipinfo("bin/run", stat.S_IFREG | 0o755), "#!/bin/sh")
+        zip.writestr(_zipinfo("data.txt", stat.S_IFREG | 0o644), "data")
+        zip.writestr(_zipinfo("link", stat.S_IFLNK | 0o777), "data.txt")
+        zip.writestr("../evil.txt", "evil")
+        for i in range(16):
+            zip.writestr(f"many/{i}.bin", os.urandom(1024 * i))
+    return path
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_extractall(archive, tmp_path, max_workers):
+    dest = tmp_path / "out"
+    with ZipFileWithExecPerm(archive) as zip:
+        zip.extractall(dest, max_workers=max_workers)
+        for i in range(16):
+            with open(dest / "many" / f"{i}.bin", "rb") as f:
+                assert f.read() == zip.read(f"many/{i}.bin")
+
+    assert (dest / "data.txt").read_text() == "data"
+    # `..` is stripped, as by `ZipFile.extractall`
+    assert (dest / "evil.txt").read_text() == "evil"
+    assert not (tmp_path / "evil.txt").exists()
+
+    if sys.platform != "win32":
+        assert os.stat(dest / "bin" / "run").st_mode & 0o777 == 0o755
+        assert os.stat(dest / "data.txt").st_mode & 0o777 == 0o644
+        assert op.islink(dest / "link")
+        assert os.readlink(dest / "link") == "data.txt"
+
+    # Extracting again overwrites existing files and links
+    with ZipFileWithExecPerm(archive) as zip:
+        zip.extractall(dest, max_workers=max_workers)
+    assert (dest / "data.txt").read_text() == "data"
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_extractall_stop(archive, tmp_path, max_workers):
+    dest = tmp_path / "out"
+    stop = threading.Event()
+    stop.set()
+    with ZipFileWithExecPerm(archive) as zip:
+        zip.extractall(dest, max_workers=max_workers, stop=stop)
+    assert not dest.exists() or not os.listdir(dest)